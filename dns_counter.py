@@ -13,7 +13,7 @@ Hardware Requirements:
 Key Features:
     - Real-time display of elapsed time in years, months, days, hours, minutes, seconds
     - Physical button reset functionality with audio feedback
-    - Persistent state storage across reboots using JSON file
+    - Persistent state storage across reboots using a compact binary file
     - Thread-based button monitoring for non-blocking operation
     - Atomic file writes to prevent state corruption
     - Comprehensive logging to both console and syslog
@@ -23,20 +23,23 @@ The counter can be reset by pressing the physical button, which also plays an au
 notification using the system's aplay utility.
 """
 import argparse
+import atexit
 import json
 import logging
 import os
+import queue
+import signal
+import struct
 import subprocess
 import tempfile
 import threading
 import time
 from datetime import datetime, timedelta, timezone
-from logging.handlers import SysLogHandler
-from typing import Any, Dict, Optional, Tuple
+from logging.handlers import QueueHandler, QueueListener, SysLogHandler
+from typing import Any, Dict, List, Optional, Tuple
 
 import gpiod
 import yaml
-from PIL import ImageDraw, ImageFont
 from rgbmatrix import RGBMatrix, RGBMatrixOptions, graphics
 
 # Prometheus metrics - import from shared module
@@ -45,9 +48,18 @@ from metrics import (
     AUDIO_PLAYBACK_ERRORS, APP_START_TIME, PROMETHEUS_AVAILABLE
 )
 
+# Optional in-process audio backend (audio_backend: simpleaudio)
+try:
+    import simpleaudio
+
+    SIMPLEAUDIO_AVAILABLE = True
+except ImportError:
+    SIMPLEAUDIO_AVAILABLE = False
+
+
 # Set up logging with more detail
 logger = logging.getLogger("dns_counter")
-logger.setLevel(logging.DEBUG)  # Change to DEBUG level
+logger.setLevel(logging.INFO)  # Overridden by config log_level or --verbose
 
 # Add console handler with detailed formatting
 console = logging.StreamHandler()
@@ -71,6 +83,26 @@ try:
 except (OSError, IOError) as e:
     logger.warning(f"Could not initialize syslog handler: {e}")
 
+# Hand records to a background listener thread, so logging calls from the
+# button, web and display threads never block on stderr or /dev/log. The
+# listener is stopped (draining the queue) at exit, before logging.shutdown().
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_listener = QueueListener(
+    log_queue, *logger.handlers, respect_handler_level=True
+)
+logger.handlers = [QueueHandler(log_queue)]
+log_listener.start()
+atexit.register(log_listener.stop)
+
+
+# Binary state file layout: little-endian float64 UNIX timestamp + uint32 version.
+# web_server.py reads and writes the same layout.
+STATE_STRUCT = struct.Struct("<dI")
+STATE_VERSION = 2
+
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_config(
     config_path: str = "/usr/local/share/dnsfail/config.yaml",
@@ -87,6 +119,7 @@ def load_config(
         "gpio_pin": 19,
         "brightness": 80,
         "audio_file": "/usr/local/share/dnsfail/media/fail.wav",
+        "audio_backend": "aplay",
         "web_port": 5000,
         "persistence_file": "/usr/local/share/dnsfail/last_reset.json",
         "log_level": "INFO",
@@ -94,7 +127,7 @@ def load_config(
 
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            loaded_config = yaml.safe_load(f)
+            loaded_config = yaml.load(f, Loader=YAML_LOADER)
 
         # Merge loaded config into defaults (loaded values override)
         if loaded_config:
@@ -132,7 +165,7 @@ class DNSCounter(object):
         - Physical button on configurable GPIO pin (active low with pull-up)
 
     State Management:
-        - Counter state persists across reboots via JSON file (configurable path)
+        - Counter state persists across reboots via binary file (configurable path)
         - Atomic writes using temporary files prevent corruption
         - Graceful fallback to current time if state cannot be loaded
 
@@ -144,8 +177,11 @@ class DNSCounter(object):
         parser: Command-line argument parser for matrix configuration
         args: Parsed command-line arguments
         config: Configuration dictionary loaded from YAML file
-        persistence_file: Path to JSON file for state persistence
+        persistence_file: Path to binary file for state persistence
         matrix: RGB matrix display object
+        header_font: BDF font for the "DAYS SINCE" / "DNS" header
+        time_font: BDF font for the elapsed time lines
+        headers: Precomputed (x, y, text) positions for the header lines
         last_reset: Timestamp of the last counter reset
         BUTTON_PIN: GPIO pin number for reset button (from config)
         chip: GPIO chip handle for hardware access
@@ -153,6 +189,9 @@ class DNSCounter(object):
         button_thread: Background thread monitoring button state
     """
 
+    # Resets closer together than this are collapsed into the first one
+    RESET_DEBOUNCE_SECONDS = 1.0
+
     def __init__(self) -> None:
         """Initialize the DNS counter with hardware and restore state.
 
@@ -178,6 +217,8 @@ class DNSCounter(object):
                 "falling back to INFO"
             )
             logger.setLevel(logging.INFO)
+        if self.args.verbose:
+            logger.setLevel(logging.DEBUG)
 
         # Set instance variables from config
         self.persistence_file: str = self.config["persistence_file"]
@@ -199,7 +240,8 @@ class DNSCounter(object):
         options.hardware_mapping = "adafruit-hat"
         options.scan_mode = 1  # Progressive scan mode
         options.disable_hardware_pulsing = False  # Enable hardware pulsing
-        options.drop_privileges = True  # Allow privilege dropping
+        # Keep privileges so the state file and GPIO stay writable after init
+        options.drop_privileges = False
 
         try:
             self.matrix: RGBMatrix = RGBMatrix(options=options)
@@ -208,8 +250,22 @@ class DNSCounter(object):
             logger.error(f"Failed to initialize matrix: {e}")
             raise
 
-        # Initialize the last reset time from persistence or current time
+        self._init_display_assets()
+
+        # Initialize the last reset time from persistence or current time.
+        # _state_lock guards last_reset, which the button, web and display
+        # threads all share.
+        self._state_lock = threading.Lock()
+        # _save_lock serializes state file writes, which happen outside
+        # _state_lock so the display loop never waits on an fsync
+        self._save_lock = threading.Lock()
+        self._last_saved_payload: Optional[bytes] = None
         self.last_reset: datetime = self.load_state()
+        # last_reset as a UNIX timestamp, so the display loop can compute the
+        # elapsed time with float arithmetic instead of datetime objects
+        self._reset_ts: float = self.last_reset.timestamp()
+        # time.monotonic() of the last accepted reset, for debouncing
+        self._last_reset_monotonic: Optional[float] = None
         logger.info(f"Counter initialized with start time: {self.last_reset}")
 
         # Initialize GPIO for button
@@ -218,35 +274,126 @@ class DNSCounter(object):
         self.line: Any = None  # gpiod.Line (v1) or LineRequest (v2)
         self.button_thread: Optional[threading.Thread] = None
         self._gpiod_version: int = 1  # Will be set by setup_gpio
+        # _audio_lock guards _audio_proc, which resets start (button and web
+        # threads) and the button thread reaps
+        self._audio_lock = threading.Lock()
+        self._audio_proc: Optional[subprocess.Popen] = None
+        self._play_obj: Any = None  # simpleaudio.PlayObject
+        self._wave_obj: Any = self._load_wave()  # simpleaudio.WaveObject
+
+        # Minimal environment for the audio player, built once. HOME and
+        # XDG_RUNTIME_DIR point at /tmp to avoid PulseAudio permission errors
+        # when running as a different user; ALSA_* settings are passed through.
+        self._aplay_env: Dict[str, str] = {
+            "PATH": os.environ.get("PATH", os.defpath),
+            "HOME": "/tmp",
+            "XDG_RUNTIME_DIR": "/tmp",
+            **{k: v for k, v in os.environ.items() if k.startswith("ALSA_")},
+        }
+        # aplay command line, also fixed for the lifetime of the process. An
+        # explicit 100ms buffer / 25ms period keeps aplay from picking the
+        # card's (often 500ms+) default buffer, which it fills before the
+        # first sample is heard.
+        self._aplay_cmd: List[str] = [
+            "aplay", "-q", "--buffer-time=100000", "--period-time=25000",
+        ]
+        if self.config.get("audio_device"):
+            self._aplay_cmd.extend(["-D", self.config["audio_device"]])
+        self._aplay_cmd.append(self.config["audio_file"])
         self.setup_gpio()
 
+    def _init_display_assets(self) -> None:
+        """Load fonts, colors, and text positions used by the display loop.
+
+        Everything here is fixed for the lifetime of the process, so it is
+        prepared once rather than inside run()'s per-frame loop.
+        """
+        # Use system font directory
+        font_dir = "/usr/local/share/dnsfail/fonts"
+
+        self.header_font = graphics.Font()
+        self.header_font.LoadFont(os.path.join(font_dir, "6x10.bdf"))
+
+        self.time_font = graphics.Font()
+        self.time_font.LoadFont(os.path.join(font_dir, "5x8.bdf"))  # More readable
+
+        # Create colors
+        self.white = graphics.Color(255, 255, 255)
+        self.red = graphics.Color(255, 0, 0)
+        self.black = graphics.Color(0, 0, 0)
+
+        # Header text never changes, so center it once up front
+        self.headers: List[Tuple[int, int, str]] = [
+            ((64 - len(text) * 6) // 2, y, text)
+            for text, y in (("DAYS SINCE", 8), ("DNS", 16))
+        ]
+
+        # format_duration pads every unit to two digits, so the time lines keep
+        # a fixed width and their centered positions can be computed up front
+        time_line1, time_line2 = self.format_duration(0)
+        self.time_line1_x: int = (64 - len(time_line1) * 5) // 2
+        self.time_line2_x: int = (64 - len(time_line2) * 5) // 2
+
     def save_state(self) -> None:
-        """Save the last_reset timestamp to JSON file using atomic write.
+        """Save the last_reset timestamp to the binary state file using atomic write.
 
-        Uses a temporary file and atomic rename to ensure the persistence file
-        is never left in a corrupt state, even if the program crashes during write.
+        The file holds a single STATE_STRUCT record (UNIX timestamp and format
+        version, 12 bytes). Uses a temporary file and atomic rename to ensure
+        the persistence file is never left in a corrupt state, even if the
+        program crashes during write. The temporary file and its directory are
+        fsynced so the new contents survive a power loss, not just a process
+        crash. Writes are skipped when the payload matches the last one saved.
+        If the write fails, the temporary file is removed and the existing
+        state file is left untouched.
 
         Note:
             Logs errors but does not raise exceptions to prevent crashes during
             normal operation.
         """
+        tmp_name: Optional[str] = None
         try:
-            data = {"last_reset": self.last_reset.isoformat(), "version": 1}
+            payload = STATE_STRUCT.pack(self.last_reset.timestamp(), STATE_VERSION)
+            if payload == self._last_saved_payload:
+                logger.debug("State unchanged, skipping save")
+                return
+            dir_path = os.path.dirname(self.persistence_file)
             # Use a temporary file for atomic write
             with tempfile.NamedTemporaryFile(
-                mode="w",
+                mode="wb",
                 delete=False,
-                dir=os.path.dirname(self.persistence_file),
-                encoding="utf-8",
+                dir=dir_path,
             ) as tf:
-                json.dump(data, tf)
-            os.rename(tf.name, self.persistence_file)
-            logger.debug(f"Saved state to {self.persistence_file}: {data}")
+                tmp_name = tf.name
+                tf.write(payload)
+                tf.flush()
+                os.fsync(tf.fileno())
+            os.replace(tf.name, self.persistence_file)
+            tmp_name = None
+            # Persist the rename itself by syncing the directory entry
+            dir_fd = os.open(dir_path or ".", os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+            self._last_saved_payload = payload
+            logger.debug(
+                "Saved state to %s: %s", self.persistence_file, self.last_reset
+            )
         except Exception as e:
             logger.error(f"Failed to save state to {self.persistence_file}: {e}")
+            # Don't leave a stray temporary file next to the state file
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
 
     def load_state(self) -> datetime:
-        """Load the last_reset timestamp from JSON persistence file.
+        """Load the last_reset timestamp from the persistence file.
+
+        Reads the binary STATE_STRUCT record written by save_state, falling back
+        to the JSON format written by earlier releases so existing state files
+        migrate on the next save.
 
         Implements graceful degradation: if the file doesn't exist, is corrupt,
         or has any other issues, returns the current time instead of failing.
@@ -266,8 +413,19 @@ class DNSCounter(object):
             return datetime.now(timezone.utc)
 
         try:
-            with open(self.persistence_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.persistence_file, "rb") as f:
+                raw = f.read()
+
+            if len(raw) == STATE_STRUCT.size:
+                timestamp, _version = STATE_STRUCT.unpack(raw)
+                loaded_time = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+                logger.info(
+                    f"Loaded last_reset from {self.persistence_file}: {loaded_time}"
+                )
+                return loaded_time
+
+            # Legacy JSON state file from an earlier release
+            data = json.loads(raw)
 
             last_reset_str = data.get("last_reset")
             if last_reset_str:
@@ -295,49 +453,140 @@ class DNSCounter(object):
             )
             return datetime.now(timezone.utc)
 
-    def reset(self) -> datetime:
-        """Reset the counter, save state, and play audio.
+    def reset(self, source: str = "button") -> Tuple[datetime, bool]:
+        """Reset the counter, start the reset sound, and save state.
 
         This method is called by both the physical button and web interface
-        to ensure synchronized state.
+        to ensure synchronized state. The sound is started before the state
+        file is written, so the fsync doesn't delay it; audio playback runs in
+        the background, so this returns as soon as the state is saved.
+
+        Resets arriving within RESET_DEBOUNCE_SECONDS of the previous one
+        (a stuck button or a client hammering /api/reset) are ignored: no
+        state write, no sound, and no reset counted in metrics.
+
+        Args:
+            source: Where the reset came from ('button' or 'web'), used as the
+                Prometheus reset counter label
 
         Returns:
-            datetime: The new last_reset timestamp
+            Tuple of (last_reset, accepted): the new timestamp and True, or the
+            unchanged timestamp and False if the reset was debounced
         """
-        self.last_reset = datetime.now(timezone.utc)
-        self.save_state()
-
-        # Play audio
-        sound_file = self.config["audio_file"]
-        audio_device = self.config.get("audio_device", "")
+        with self._state_lock:
+            now = time.monotonic()
+            if (
+                self._last_reset_monotonic is not None
+                and now - self._last_reset_monotonic < self.RESET_DEBOUNCE_SECONDS
+            ):
+                logger.debug("Ignoring %s reset %.3fs after the previous one",
+                             source, now - self._last_reset_monotonic)
+                return self.last_reset, False
+            self._last_reset_monotonic = now
+            self.last_reset = datetime.now(timezone.utc)
+            self._reset_ts = self.last_reset.timestamp()
+            last_reset = self.last_reset
+        if PROMETHEUS_AVAILABLE:
+            RESET_COUNTER.labels(source=source).inc()
+        self._play_audio()
+        with self._save_lock:
+            self.save_state()
+
+        return last_reset, True
+
+    def _load_wave(self) -> Any:
+        """Preload the reset sound for the in-process simpleaudio backend.
 
+        Returns:
+            simpleaudio.WaveObject holding the decoded sound, or None when the
+            aplay backend is configured or the sound cannot be loaded (in which
+            case playback falls back to aplay).
+        """
+        if self.config.get("audio_backend") != "simpleaudio":
+            return None
+        if not SIMPLEAUDIO_AVAILABLE:
+            logger.warning("simpleaudio not installed, falling back to aplay")
+            return None
         try:
-            logger.debug("Playing reset sound...")
-            # Use shell wrapper to ensure fresh ALSA context (fixes Docker startup race)
-            play_script = "/app/play_audio.sh"
-            if os.path.exists(play_script):
-                aplay_cmd = ["bash", play_script, audio_device or "default", sound_file]
-            else:
-                # Fallback to direct aplay for non-Docker environments
-                aplay_cmd = ["aplay"]
-                if audio_device:
-                    aplay_cmd.extend(["-D", audio_device])
-                aplay_cmd.append(sound_file)
-            logger.debug(f"Running: {' '.join(aplay_cmd)}")
-            result = subprocess.run(
-                aplay_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-            if result.returncode != 0:
-                logger.error(f"Audio error: {result.stderr}")
-            else:
-                logger.debug("Sound playback completed successfully")
+            wave_obj = simpleaudio.WaveObject.from_wave_file(self.config["audio_file"])
+            logger.info("Reset sound preloaded for in-process playback")
+            return wave_obj
         except Exception as e:
-            logger.error(f"Error playing sound: {e}", exc_info=True)
+            logger.warning(
+                f"Could not preload reset sound ({e}), falling back to aplay"
+            )
+            return None
+
+    def _play_audio(self) -> None:
+        """Start the reset sound without waiting for playback to finish.
 
-        return self.last_reset
+        With audio_backend set to "simpleaudio", plays the preloaded sound
+        in-process. Otherwise execs aplay directly with Popen. Either way the
+        caller returns immediately instead of blocking for the length of the
+        sound. If the previous sound is still playing it is stopped first.
+        aplay's own error messages go to our stderr (journald/docker logs);
+        its exit status is checked by _reap_audio().
+
+        Note:
+            Logs errors but does not raise exceptions.
+        """
+        if self._wave_obj is not None:
+            # In-process playback from the preloaded buffer: no fork/exec or
+            # file read per reset
+            try:
+                if self._play_obj is not None and self._play_obj.is_playing():
+                    self._play_obj.stop()
+                self._play_obj = self._wave_obj.play()
+            except Exception as e:
+                logger.error(f"Error playing sound: {e}", exc_info=True)
+                if PROMETHEUS_AVAILABLE:
+                    AUDIO_PLAYBACK_ERRORS.inc()
+            return
+
+        with self._audio_lock:
+            previous = self._audio_proc
+            if previous is not None and previous.poll() is None:
+                logger.debug("Stopping previous reset sound")
+                previous.kill()
+                previous.wait()
+            elif previous is not None:
+                # Finished before the button thread got to it
+                self._report_audio_exit(previous)
+
+            try:
+                logger.debug("Running: %s", self._aplay_cmd)
+                self._audio_proc = subprocess.Popen(
+                    self._aplay_cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=None,  # Keep ALSA errors visible in the service log
+                    env=self._aplay_env,
+                )
+            except Exception as e:
+                self._audio_proc = None
+                logger.error(f"Error playing sound: {e}", exc_info=True)
+                if PROMETHEUS_AVAILABLE:
+                    AUDIO_PLAYBACK_ERRORS.inc()
+
+    def _reap_audio(self) -> None:
+        """Collect a finished aplay process and report it if it failed.
+
+        Called by the button thread every time its 1s wait times out, so a
+        failed reset sound is logged and counted within about a second
+        instead of on the next reset.
+        """
+        with self._audio_lock:
+            proc = self._audio_proc
+            if proc is None or proc.poll() is None:
+                return
+            self._audio_proc = None
+            self._report_audio_exit(proc)
+
+    def _report_audio_exit(self, proc: subprocess.Popen) -> None:
+        """Log and count a finished aplay process that exited with an error."""
+        if proc.returncode != 0:
+            logger.error(f"Audio error: aplay exited with {proc.returncode}")
+            if PROMETHEUS_AVAILABLE:
+                AUDIO_PLAYBACK_ERRORS.inc()
 
     def get_last_reset(self) -> datetime:
         """Get the current last_reset timestamp.
@@ -345,7 +594,8 @@ class DNSCounter(object):
         Returns:
             datetime: The current last_reset value
         """
-        return self.last_reset
+        with self._state_lock:
+            return self.last_reset
 
     def create_parser(self) -> argparse.ArgumentParser:
         """Create and configure argument parser for LED matrix options.
@@ -461,6 +711,11 @@ class DNSCounter(object):
             type=int,
             default=4,
         )
+        parser.add_argument(
+            "--verbose",
+            action="store_true",
+            help="Enable DEBUG logging, overriding log_level from the config file",
+        )
         parser.add_argument(
             "--config",
             action="store",
@@ -471,11 +726,11 @@ class DNSCounter(object):
 
         return parser
 
-    def format_duration(self, duration: timedelta) -> Tuple[str, str]:
-        """Format duration into two display lines showing all time units.
+    def format_duration(self, total_seconds: int) -> Tuple[str, str]:
+        """Format a duration into two display lines showing all time units.
 
         Args:
-            duration: Time duration to format
+            total_seconds: Elapsed time in whole seconds
 
         Returns:
             Tuple[str, str]: Two formatted strings:
@@ -486,112 +741,18 @@ class DNSCounter(object):
             Months are approximated as 30-day periods. For precise date arithmetic,
             consider using dateutil or similar library.
         """
-        # Calculate all time components
-        total_seconds = int(duration.total_seconds())
-
-        # Break down into units
-        years = duration.days // 365
-        months = (duration.days % 365) // 30
-        days = (duration.days % 365) % 30
-        hours = total_seconds // 3600 % 24
-        minutes = total_seconds % 3600 // 60
-        seconds = total_seconds % 60
+        # Break down into units with a single divmod cascade
+        minutes, seconds = divmod(total_seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        days, hours = divmod(hours, 24)
+        years, days = divmod(days, 365)
+        months, days = divmod(days, 30)
 
         # Format as two lines with units, using 'mo' for months
-        line1 = f"{years:02d}y {months:02d}mo {days:02d}d"
-        line2 = f"{hours:02d}h {minutes:02d}m {seconds:02d}s"
+        line1 = "%02dy %02dmo %02dd" % (years, months, days)
+        line2 = "%02dh %02dm %02ds" % (hours, minutes, seconds)
         return (line1, line2)
 
-    def get_max_font_size(
-        self,
-        draw: ImageDraw.ImageDraw,
-        text: str,
-        max_width: int,
-        max_height: int,
-        start_size: int = 20,
-    ) -> ImageFont.FreeTypeFont:
-        """Determine the largest font size that fits text in given space.
-
-        Args:
-            draw: PIL ImageDraw object for measuring text
-            text: Text string to size
-            max_width: Maximum width in pixels
-            max_height: Maximum height in pixels
-            start_size: Initial font size to try (default: 20)
-
-        Returns:
-            ImageFont.FreeTypeFont: Font object at largest size that fits
-
-        Note:
-            Uses binary search approach, decreasing from start_size until text fits.
-            Minimum font size is 6 pixels for readability.
-        """
-        font_size = start_size
-        font = ImageFont.truetype(
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size
-        )
-
-        while font_size > 6:  # Minimum readable size
-            font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size
-            )
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-
-            if text_width <= max_width and text_height <= max_height:
-                return font
-
-            font_size -= 1
-
-        return font
-
-    def draw_text(
-        self,
-        draw: ImageDraw.ImageDraw,
-        text: str,
-        x: int,
-        y: int,
-        color: Tuple[int, int, int],
-        size_multiplier: int = 1,
-    ) -> None:
-        """Draw text using custom bitmap font.
-
-        Args:
-            draw: PIL ImageDraw object to draw on
-            text: Text string to render
-            x: Starting x coordinate
-            y: Starting y coordinate
-            color: RGB color tuple (R, G, B)
-            size_multiplier: Scale factor for font size (default: 1)
-
-        Note:
-            Uses self.font_5x7 bitmap font definition. Each character is 5x7 pixels
-            with 1 pixel spacing. Characters not in font are skipped.
-        """
-        current_x = x
-        for char in text:
-            if char in self.font_5x7:
-                bitmap = self.font_5x7[char]
-                for row in range(7):
-                    for col in range(5):
-                        if bitmap[col] & (1 << (6 - row)):
-                            pixel_x = current_x + (col * size_multiplier)
-                            pixel_y = y + (row * size_multiplier)
-                            if size_multiplier == 1:
-                                draw.point((pixel_x, pixel_y), color)
-                            else:
-                                draw.rectangle(
-                                    [
-                                        pixel_x,
-                                        pixel_y,
-                                        pixel_x + size_multiplier - 1,
-                                        pixel_y + size_multiplier - 1,
-                                    ],
-                                    fill=color,
-                                )
-            current_x += 6 * size_multiplier  # 5 pixels + 1 space between characters
-
     def test_display(self) -> None:
         """Test RGB matrix with red, green, blue color sequence.
 
@@ -603,31 +764,11 @@ class DNSCounter(object):
         """
         canvas = self.matrix.CreateFrameCanvas()
 
-        # Fill with red
-        for x in range(64):
-            for y in range(32):
-                canvas.SetPixel(x, y, 255, 0, 0)
-
-        canvas = self.matrix.SwapOnVSync(canvas)
-        time.sleep(2)
-
-        # Fill with green
-        canvas.Clear()
-        for x in range(64):
-            for y in range(32):
-                canvas.SetPixel(x, y, 0, 255, 0)
-
-        canvas = self.matrix.SwapOnVSync(canvas)
-        time.sleep(2)
-
-        # Fill with blue
-        canvas.Clear()
-        for x in range(64):
-            for y in range(32):
-                canvas.SetPixel(x, y, 0, 0, 255)
-
-        canvas = self.matrix.SwapOnVSync(canvas)
-        time.sleep(2)
+        # Fill each color with a single C-level Fill() rather than 2048 SetPixel calls
+        for r, g, b in ((255, 0, 0), (0, 255, 0), (0, 0, 255)):
+            canvas.Fill(r, g, b)
+            canvas = self.matrix.SwapOnVSync(canvas)
+            time.sleep(2)
 
         canvas.Clear()
         self.matrix.SwapOnVSync(canvas)
@@ -639,7 +780,9 @@ class DNSCounter(object):
             - Top: "DAYS SINCE" / "DNS" header in white
             - Bottom: Elapsed time in two lines (YYy MMmo DDd / HHh MMm SSs) in red
 
-        Updates display every second. Runs until interrupted with Ctrl+C.
+        Wakes on a monotonic 1Hz deadline aligned to each whole-second rollover
+        of the elapsed time, and skips formatting and redrawing when the whole
+        elapsed second has not changed. Runs until interrupted with Ctrl+C.
 
         Raises:
             KeyboardInterrupt: Caught and handled gracefully with cleanup
@@ -650,74 +793,92 @@ class DNSCounter(object):
         """
         try:
             logger.info("Starting display loop...")
-            canvas = self.matrix.CreateFrameCanvas()
-
-            # Use system font directory
-            font_dir = "/usr/local/share/dnsfail/fonts"
-
-            header_font = graphics.Font()
-            header_font.LoadFont(os.path.join(font_dir, "6x10.bdf"))
-
-            time_font = graphics.Font()
-            time_font.LoadFont(os.path.join(font_dir, "5x8.bdf"))  # More readable size
-
-            # Create colors
-            white = graphics.Color(255, 255, 255)
-            red = graphics.Color(255, 0, 0)
+            # Preallocate a double-buffered pair and draw the header into both
+            # once, so frames only need to repaint the time region below it.
+            # Frames alternate explicitly between the two buffers.
+            buffers = [self.matrix.CreateFrameCanvas() for _ in range(2)]
+            for buffer in buffers:
+                buffer.Clear()
+                for x, y, text in self.headers:
+                    graphics.DrawText(
+                        buffer, self.header_font, x, y, self.white, text
+                    )
+            back = 0
+            # Line 1 (YYy MMmo DDd) text currently drawn in each buffer; it
+            # only changes once a day, so it is redrawn only when stale
+            drawn_line1: List[Optional[str]] = [None, None]
+
+            # Whole elapsed seconds shown in the last rendered frame
+            last_seconds: Optional[int] = None
+            # Reset timestamp the tick phase was derived from, and the
+            # monotonic deadline of the next tick
+            anchor: Optional[float] = None
+            next_tick = time.monotonic()
 
             while True:
-                canvas.Clear()
-
-                # Draw header text in two lines
-                header_text1 = "DAYS SINCE"
-                header_text2 = "DNS"
-
-                # Draw headers
-                graphics.DrawText(
-                    canvas,
-                    header_font,
-                    (64 - len(header_text1) * 6) // 2,
-                    8,
-                    white,
-                    header_text1,
-                )
-
-                graphics.DrawText(
-                    canvas,
-                    header_font,
-                    (64 - len(header_text2) * 6) // 2,
-                    16,
-                    white,
-                    header_text2,
-                )
-
-                # Calculate and draw time in two lines
-                duration = datetime.now(timezone.utc) - self.last_reset
-                time_line1, time_line2 = self.format_duration(duration)
-
-                # Draw first line of time (MM:WW:DD)
-                graphics.DrawText(
-                    canvas,
-                    time_font,
-                    (64 - len(time_line1) * 5) // 2,
-                    24,
-                    red,
-                    time_line1,
-                )
-
-                # Draw second line of time (HH:MM:SS)
-                graphics.DrawText(
-                    canvas,
-                    time_font,
-                    (64 - len(time_line2) * 5) // 2,
-                    31,
-                    red,
-                    time_line2,
-                )
-
-                # Update the display
-                canvas = self.matrix.SwapOnVSync(canvas)
-                time.sleep(1)
+                # The time lines only change when a whole second rolls over.
+                # Read the reset time before taking "now" under the lock, so a
+                # reset landing mid-frame can never produce a negative duration.
+                # Wall-clock time.time() (not monotonic) keeps the counter
+                # correct after NTP steps the clock on an RTC-less Pi.
+                with self._state_lock:
+                    reset_ts = self._reset_ts
+                    elapsed = time.time() - reset_ts
+                seconds = max(0, int(elapsed))
+                changed = seconds != last_seconds
+
+                if changed:
+                    time_line1, time_line2 = self.format_duration(seconds)
+                    canvas = buffers[back]
+
+                    # Repaint line 1 (rows 17-24) only if this buffer shows a
+                    # different day count, keeping the header
+                    if time_line1 != drawn_line1[back]:
+                        for y in range(17, 25):
+                            graphics.DrawLine(canvas, 0, y, 63, y, self.black)
+                        graphics.DrawText(
+                            canvas,
+                            self.time_font,
+                            self.time_line1_x,
+                            24,
+                            self.red,
+                            time_line1,
+                        )
+                        drawn_line1[back] = time_line1
+
+                    # Erase and draw second line of time (HHh MMm SSs, rows 25-31)
+                    for y in range(25, 32):
+                        graphics.DrawLine(canvas, 0, y, 63, y, self.black)
+                    graphics.DrawText(
+                        canvas,
+                        self.time_font,
+                        self.time_line2_x,
+                        31,
+                        self.red,
+                        time_line2,
+                    )
+
+                    # Update the display and flip to the other buffer
+                    self.matrix.SwapOnVSync(canvas)
+                    back ^= 1
+                    last_seconds = seconds
+
+                # Tick at a fixed 1Hz on the monotonic clock, phase-locked to
+                # the elapsed-second rollover. The phase is re-derived on start,
+                # after a reset, and whenever a tick lands before the rollover
+                # (e.g. the wall clock was stepped by NTP after boot).
+                if reset_ts != anchor or not changed:
+                    anchor = reset_ts
+                    next_tick = time.monotonic() + (1 - elapsed % 1)
+                else:
+                    next_tick += 1.0
+
+                slack = next_tick - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
+                elif slack < -1.0:
+                    # Fell more than a tick behind; resync on the next pass
+                    anchor = None
 
         except KeyboardInterrupt:
             logger.info("Shutting down...")
@@ -738,8 +899,11 @@ class DNSCounter(object):
     def setup_gpio(self) -> None:
         """Initialize GPIO for button input using gpiod library.
 
-        Configures GPIO line from config as input with pull-up resistor, then
-        spawns a daemon thread to monitor button state.
+        Configures GPIO line from config as input with pull-up resistor and
+        falling-edge event detection, then spawns a daemon thread to wait for
+        button press events. With gpiod v2 the kernel also debounces the line
+        (50ms); _check_button keeps its 300ms guard for v1, which has no
+        debounce setting.
 
         Note:
             Logs errors but does not raise exceptions. Sets chip and line to None
@@ -760,6 +924,10 @@ class DNSCounter(object):
                         self.BUTTON_PIN: gpiod.LineSettings(
                             direction=gpiod.line.Direction.INPUT,
                             bias=gpiod.line.Bias.PULL_UP,
+                            edge_detection=gpiod.line.Edge.FALLING,
+                            # Kernel-side debounce so contact bounce never
+                            # reaches userspace as extra edge events
+                            debounce_period=timedelta(milliseconds=50),
                         )
                     },
                 )
@@ -772,11 +940,11 @@ class DNSCounter(object):
                 self.line = self.chip.get_line(self.BUTTON_PIN)
                 self.line.request(
                     consumer="dns_counter",
-                    type=gpiod.LINE_REQ_DIR_IN,
+                    type=gpiod.LINE_REQ_EV_FALLING_EDGE,
                     flags=gpiod.LINE_REQ_FLAG_BIAS_PULL_UP,
                 )
 
-            logger.info("GPIO setup successful with pull-up enabled")
+            logger.info("GPIO setup successful with pull-up and edge events enabled")
 
             # Start a thread to check the button state
             self.button_thread = threading.Thread(
@@ -806,103 +974,106 @@ class DNSCounter(object):
             # v1 API: get_value returns int directly
             return self.line.get_value()
 
+    def _wait_for_press(self, timeout: float) -> bool:
+        """Block until a falling edge arrives, handling gpiod v1 and v2 APIs.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if a falling edge (button press) was read, False on timeout.
+        """
+        if self._gpiod_version == 2:
+            if self.line.wait_edge_events(timedelta(seconds=timeout)):
+                # Drain all pending events; bounce edges collapse into one press
+                self.line.read_edge_events()
+                return True
+            return False
+        else:
+            if self.line.event_wait(sec=int(timeout)):
+                self.line.event_read()
+                return True
+            return False
+
     def _check_button(self) -> None:
-        """Thread function to continuously monitor button state.
+        """Thread function to wait for button press events.
 
-        Polls button every 100ms and detects press events (transition to 0).
-        When pressed, resets counter, saves state, and plays audio notification.
+        Blocks in the kernel on falling-edge events instead of polling, so the
+        thread only wakes when the button is pressed (or once per second on the
+        wait timeout). When pressed, resets counter, saves state, and plays
+        audio notification.
 
         Note:
             Runs in daemon thread - will not prevent program exit. Uses 300ms
-            debounce to prevent multiple triggers. Accesses shared self.last_reset
-            state - thread-safe due to Python GIL and atomic datetime assignment.
-            Sets HOME and XDG_RUNTIME_DIR environment variables to /tmp to avoid
-            PulseAudio permission errors when running as different user.
+            debounce on a monotonic clock to reject edges generated by contact
+            bounce. Updates shared self.last_reset through reset(), which
+            holds _state_lock. Errors back off exponentially (capped at 30s);
+            after 10 consecutive errors the thread exits and the display keeps
+            running without the button.
         """
-        last_press = 0
-        last_value = None
+        last_press_ns = 0
         logger.info("Button monitoring started")
-        logger.info(f"Initial button state: {self._get_button_value()}")
+        logger.info("Initial button state: %s", self._get_button_value())
 
         # Get absolute path to sound file from config
         sound_file = self.config["audio_file"]
         audio_device = self.config.get("audio_device", "")  # Optional device
-        logger.debug(f"Sound file path: {sound_file}")
-        logger.debug(f"Sound file exists: {os.path.exists(sound_file)}")
-        logger.debug(f"Audio device: {audio_device or 'default'}")
-
-        # Wait for audio devices to be fully available (container startup issue)
-        for attempt in range(10):
-            test_result = subprocess.run(
-                ["aplay", "-l"], capture_output=True, text=True
-            )
-            if "Headphones" in test_result.stdout:
-                logger.info(f"Audio devices ready after {attempt + 1} attempts")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sound file path: %s", sound_file)
+            logger.debug("Sound file exists: %s", os.path.exists(sound_file))
+            logger.debug("Audio device: %s", audio_device or "default")
+
+        # Wait for audio devices to be fully available (container startup issue).
+        # Reads the kernel's card list directly instead of forking aplay -l,
+        # so it can poll every 250ms for the same 10s budget.
+        cards = ""
+        for attempt in range(40):
+            try:
+                with open("/proc/asound/cards", "r", encoding="utf-8") as f:
+                    cards = f.read()
+            except OSError:
+                cards = ""
+            if "Headphones" in cards:
+                logger.info(f"Audio devices ready after {attempt * 0.25:.2f}s")
                 break
-            logger.warning(f"Waiting for audio devices (attempt {attempt + 1}/10)...")
-            time.sleep(1)
+            if attempt % 4 == 0:
+                logger.warning(f"Waiting for audio devices ({attempt // 4 + 1}/10s)...")
+            time.sleep(0.25)
         else:
-            logger.error(f"Audio devices not fully available: {test_result.stdout[:200]}")
+            logger.error(f"Audio devices not fully available: {cards[:200]!r}")
 
+        consecutive_errors = 0
         while True:
             try:
-                if self.line:
-                    value = self._get_button_value()
-                    if value != last_value:
-                        logger.debug(f"Button state changed to: {value}")
-                        last_value = value
-
-                        if value == 0:  # Button pressed (active low)
-                            current_time = time.time()
-                            if current_time - last_press > 0.3:  # Simple debounce
-                                logger.info("Button press detected - Resetting counter")
-                                # Increment Prometheus counter for button resets
-                                if PROMETHEUS_AVAILABLE:
-                                    RESET_COUNTER.labels(source='button').inc()
-                                self.last_reset = datetime.now(timezone.utc)
-                                self.save_state()  # Save the new reset time
-                                try:
-                                    logger.debug("Attempting to play sound...")
-                                    # Use shell wrapper for fresh ALSA context
-                                    play_script = "/app/play_audio.sh"
-                                    if os.path.exists(play_script):
-                                        aplay_cmd = [
-                                            "bash",
-                                            play_script,
-                                            audio_device or "default",
-                                            sound_file,
-                                        ]
-                                    else:
-                                        aplay_cmd = ["aplay"]
-                                        if audio_device:
-                                            aplay_cmd.extend(["-D", audio_device])
-                                        aplay_cmd.append(sound_file)
-                                    logger.debug(f"Running: {' '.join(aplay_cmd)}")
-                                    result = subprocess.run(
-                                        aplay_cmd,
-                                        stdout=subprocess.PIPE,
-                                        stderr=subprocess.PIPE,
-                                        text=True,
-                                    )
-                                    if result.returncode != 0:
-                                        logger.error(f"Audio error: {result.stderr}")
-                                        if PROMETHEUS_AVAILABLE:
-                                            AUDIO_PLAYBACK_ERRORS.inc()
-                                    else:
-                                        logger.debug(
-                                            "Sound playback completed successfully"
-                                        )
-                                except Exception as e:
-                                    logger.error(
-                                        f"Error playing sound: {e}", exc_info=True
-                                    )
-                                    if PROMETHEUS_AVAILABLE:
-                                        AUDIO_PLAYBACK_ERRORS.inc()
-                                last_press = current_time
-                time.sleep(0.1)
+                pressed = self._wait_for_press(1.0)
+                consecutive_errors = 0
+                if not pressed:
+                    self._reap_audio()
+                    continue
+
+                now_ns = time.monotonic_ns()
+                if now_ns - last_press_ns <= 300_000_000:  # Reject bounce edges
+                    logger.debug("Ignoring button edge within debounce window")
+                    continue
+
+                _, accepted = self.reset(source="button")
+                if accepted:
+                    logger.info("Button press detected - Resetting counter")
+                else:
+                    logger.debug("Button press ignored - reset debounced")
+                last_press_ns = now_ns
             except Exception as e:
+                consecutive_errors += 1
                 logger.error(f"Error in button loop: {e}", exc_info=True)
-                time.sleep(0.1)
+                if consecutive_errors >= 10:
+                    # GPIO is most likely gone for good; stop instead of spinning.
+                    # The display loop keeps running without button resets.
+                    logger.critical(
+                        f"Button monitoring stopped after {consecutive_errors} "
+                        "consecutive errors"
+                    )
+                    return
+                time.sleep(min(2**consecutive_errors, 30))
 
 
 def start_web_server(dns_counter_instance: "DNSCounter") -> None:
@@ -921,16 +1092,9 @@ def start_web_server(dns_counter_instance: "DNSCounter") -> None:
             get_state_callback=dns_counter_instance.get_last_reset,
         )
 
-        # Run in background thread
+        # Run in background thread (waitress if installed, else Flask's server)
         web_thread = threading.Thread(
-            target=lambda: server.app.run(
-                host="0.0.0.0",
-                port=dns_counter_instance.config["web_port"],
-                debug=False,
-                threaded=True,
-                use_reloader=False,
-            ),
-            daemon=True,
+            target=server.run, kwargs={"host": "0.0.0.0"}, daemon=True
         )
         web_thread.start()
         logger.info(f"Web server started on port {dns_counter_instance.config['web_port']}")
@@ -941,6 +1105,10 @@ def start_web_server(dns_counter_instance: "DNSCounter") -> None:
 
 
 if __name__ == "__main__":
+    # systemd stops the service with SIGTERM; treat it like Ctrl-C so run()
+    # cleans up and atexit drains the log queue instead of dropping it
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
     try:
         dns_counter = DNSCounter()
 
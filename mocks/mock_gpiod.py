@@ -2,12 +2,25 @@
 """Mock implementation of gpiod library for Docker development."""
 import logging
 import os
+import time
 
 logger = logging.getLogger("dns_counter")
 
 # Module-level constants
 LINE_REQ_DIR_IN = 1
 LINE_REQ_FLAG_BIAS_PULL_UP = 2
+LINE_REQ_EV_FALLING_EDGE = 3
+
+# Event type constants
+FALLING_EDGE = 2
+
+
+class LineEvent:
+    """Mock GPIO LineEvent class."""
+
+    def __init__(self, event_type):
+        self.type = event_type
+        self.sec, self.nsec = divmod(time.monotonic_ns(), 1_000_000_000)
 
 
 class Line:
@@ -16,6 +29,7 @@ class Line:
     def __init__(self, pin):
         self.pin = pin
         self.consumer = None
+        self._last_value = 1
         logger.debug(f"Mock Line created for pin {pin}")
 
     def request(self, consumer=None, type=None, flags=None):
@@ -34,6 +48,29 @@ class Line:
         logger.debug(f"Line {self.pin} get_value: 1 (not pressed)")
         return 1
 
+    def event_wait(self, sec=0, nsec=0):
+        """Mock event_wait - returns True on a simulated 1 -> 0 transition.
+
+        Watches MOCK_BUTTON_PRESS for up to the given timeout and reports a
+        falling edge when it changes from unset to "1".
+        """
+        deadline = time.monotonic() + sec + nsec / 1_000_000_000
+        while True:
+            value = 0 if os.environ.get("MOCK_BUTTON_PRESS") == "1" else 1
+            edge = self._last_value == 1 and value == 0
+            self._last_value = value
+            if edge:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(0.05, remaining))
+
+    def event_read(self):
+        """Mock event_read - returns a falling edge event."""
+        logger.debug(f"Line {self.pin} event_read: falling edge")
+        return LineEvent(FALLING_EDGE)
+
     def release(self):
         """Mock release - no-op."""
         logger.debug(f"Line {self.pin} released")
@@ -104,6 +104,11 @@ def DrawText(canvas, font, x, y, color, text):
     logger.debug(f"DrawText: '{text}' at ({x}, {y})")
 
 
+def DrawLine(canvas, x1, y1, x2, y2, color):
+    """Mock DrawLine function - no-op with debug logging."""
+    logger.debug(f"DrawLine: ({x1}, {y1}) -> ({x2}, {y2})")
+
+
 # Mock graphics module
 class _GraphicsModule:
     """Mock graphics module."""
@@ -111,6 +116,7 @@ class _GraphicsModule:
     Color = Color
     Font = Font
     DrawText = staticmethod(DrawText)
+    DrawLine = staticmethod(DrawLine)
 
 
 graphics = _GraphicsModule()
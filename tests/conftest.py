@@ -1,6 +1,7 @@
 """Pytest fixtures for dns_counter tests."""
 
 import sys
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -8,15 +9,11 @@ import pytest
 # Mock hardware dependencies before any imports
 sys.modules["gpiod"] = MagicMock()
 sys.modules["rgbmatrix"] = MagicMock()
-sys.modules["PIL"] = MagicMock()
-sys.modules["PIL.Image"] = MagicMock()
-sys.modules["PIL.ImageDraw"] = MagicMock()
-sys.modules["PIL.ImageFont"] = MagicMock()
 
 
 @pytest.fixture
 def temp_persistence_file(tmp_path, monkeypatch):
-    """Provide a temporary persistence file path and patch the module constant.
+    """Provide a temporary persistence file path.
 
     Args:
         tmp_path: pytest's built-in temporary directory fixture
@@ -31,11 +28,6 @@ def temp_persistence_file(tmp_path, monkeypatch):
     # Ensure directory exists (tmp_path should exist, but be explicit)
     temp_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Patch the PERSISTENCE_FILE constant in dns_counter module
-    import dns_counter
-
-    monkeypatch.setattr(dns_counter, "PERSISTENCE_FILE", str(temp_file))
-
     yield temp_file
 
     # Cleanup is automatic via tmp_path
@@ -93,8 +85,34 @@ def dns_counter_mock(temp_persistence_file, monkeypatch):
 
     # Create a minimal mock DNSCounter that bypasses hardware initialization
     class TestDNSCounter:
+        RESET_DEBOUNCE_SECONDS = dns_counter.DNSCounter.RESET_DEBOUNCE_SECONDS
+
         def __init__(self):
             self.last_reset = datetime.now()
+            self.persistence_file = str(temp_persistence_file)
+            self._last_saved_payload = None
+            self._state_lock = threading.Lock()
+            self._save_lock = threading.Lock()
+            self._last_reset_monotonic = None
+            self.audio_plays = 0
+            self._audio_lock = threading.Lock()
+            self._audio_proc = None
+
+        def reset(self, source="button"):
+            """Use the real reset implementation."""
+            return dns_counter.DNSCounter.reset(self, source)
+
+        def _play_audio(self):
+            """Count playbacks instead of spawning aplay."""
+            self.audio_plays += 1
+
+        def _reap_audio(self):
+            """Use the real _reap_audio implementation."""
+            return dns_counter.DNSCounter._reap_audio(self)
+
+        def _report_audio_exit(self, proc):
+            """Use the real _report_audio_exit implementation."""
+            return dns_counter.DNSCounter._report_audio_exit(self, proc)
 
         def save_state(self):
             """Use the real save_state implementation."""
@@ -104,8 +122,8 @@ def dns_counter_mock(temp_persistence_file, monkeypatch):
             """Use the real load_state implementation."""
             return dns_counter.DNSCounter.load_state(self)
 
-        def format_duration(self, duration):
+        def format_duration(self, total_seconds):
             """Use the real format_duration implementation."""
-            return dns_counter.DNSCounter.format_duration(self, duration)
+            return dns_counter.DNSCounter.format_duration(self, total_seconds)
 
     yield TestDNSCounter()
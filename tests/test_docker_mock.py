@@ -123,3 +123,30 @@ def test_mock_graphics_functions():
     # DrawText should not raise
     canvas = mock_rgbmatrix.MockCanvas()
     mock_rgbmatrix.DrawText(canvas, font, 10, 10, color, "Test")
+
+
+def test_mock_button_edge_event():
+    """Test that the mock reports a falling edge when a press is simulated."""
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "mocks"))
+    import mock_gpiod
+
+    chip = mock_gpiod.Chip("/dev/gpiochip0")
+    line = chip.get_line(20)
+    line.request(
+        consumer="test",
+        type=mock_gpiod.LINE_REQ_EV_FALLING_EDGE,
+        flags=mock_gpiod.LINE_REQ_FLAG_BIAS_PULL_UP,
+    )
+
+    # No press: wait times out
+    os.environ.pop("MOCK_BUTTON_PRESS", None)
+    assert line.event_wait(sec=0) is False
+
+    # Simulated press produces exactly one edge
+    os.environ["MOCK_BUTTON_PRESS"] = "1"
+    try:
+        assert line.event_wait(sec=0) is True
+        assert line.event_read().type == mock_gpiod.FALLING_EDGE
+        assert line.event_wait(sec=0) is False
+    finally:
+        os.environ.pop("MOCK_BUTTON_PRESS", None)
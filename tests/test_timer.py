@@ -9,9 +9,10 @@ Tests cover:
 import json
 import os
 import tempfile
-from datetime import datetime, timedelta
-from unittest.mock import patch
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
 
+import pytest
 from freezegun import freeze_time
 
 
@@ -21,7 +22,9 @@ class TestDurationFormatting:
     def test_format_duration_zero(self, dns_counter_mock):
         """Zero seconds should format as all zeros."""
         duration = timedelta(seconds=0)
-        line1, line2 = dns_counter_mock.format_duration(duration)
+        line1, line2 = dns_counter_mock.format_duration(
+            int(duration.total_seconds())
+        )
 
         assert line1 == "00y 00mo 00d", f"Expected '00y 00mo 00d', got '{line1}'"
         assert line2 == "00h 00m 00s", f"Expected '00h 00m 00s', got '{line2}'"
@@ -29,7 +32,9 @@ class TestDurationFormatting:
     def test_format_duration_one_day(self, dns_counter_mock):
         """86400 seconds (1 day) should format correctly."""
         duration = timedelta(seconds=86400)
-        line1, line2 = dns_counter_mock.format_duration(duration)
+        line1, line2 = dns_counter_mock.format_duration(
+            int(duration.total_seconds())
+        )
 
         assert line1 == "00y 00mo 01d", f"Expected '00y 00mo 01d', got '{line1}'"
         assert line2 == "00h 00m 00s", f"Expected '00h 00m 00s', got '{line2}'"
@@ -37,7 +42,9 @@ class TestDurationFormatting:
     def test_format_duration_one_year(self, dns_counter_mock):
         """365 days should format as 1 year."""
         duration = timedelta(days=365)
-        line1, line2 = dns_counter_mock.format_duration(duration)
+        line1, line2 = dns_counter_mock.format_duration(
+            int(duration.total_seconds())
+        )
 
         assert line1 == "01y 00mo 00d", f"Expected '01y 00mo 00d', got '{line1}'"
         assert line2 == "00h 00m 00s", f"Expected '00h 00m 00s', got '{line2}'"
@@ -53,7 +60,9 @@ class TestDurationFormatting:
         - 16837 seconds = 4 hours, 40 minutes, 37 seconds
         """
         duration = timedelta(days=400, seconds=16837)
-        line1, line2 = dns_counter_mock.format_duration(duration)
+        line1, line2 = dns_counter_mock.format_duration(
+            int(duration.total_seconds())
+        )
 
         assert line1 == "01y 01mo 05d", f"Expected '01y 01mo 05d', got '{line1}'"
         assert line2 == "04h 40m 37s", f"Expected '04h 40m 37s', got '{line2}'"
@@ -61,7 +70,9 @@ class TestDurationFormatting:
     def test_format_duration_edge_29_days(self, dns_counter_mock):
         """29 days should NOT roll to a month (requires 30)."""
         duration = timedelta(days=29)
-        line1, line2 = dns_counter_mock.format_duration(duration)
+        line1, line2 = dns_counter_mock.format_duration(
+            int(duration.total_seconds())
+        )
 
         assert line1 == "00y 00mo 29d", f"Expected '00y 00mo 29d', got '{line1}'"
         assert line2 == "00h 00m 00s", f"Expected '00h 00m 00s', got '{line2}'"
@@ -76,7 +87,9 @@ class TestDurationFormatting:
         - Days: 364 % 30 = 4 days
         """
         duration = timedelta(days=364)
-        line1, line2 = dns_counter_mock.format_duration(duration)
+        line1, line2 = dns_counter_mock.format_duration(
+            int(duration.total_seconds())
+        )
 
         assert line1 == "00y 12mo 04d", f"Expected '00y 12mo 04d', got '{line1}'"
         assert line2 == "00h 00m 00s", f"Expected '00h 00m 00s', got '{line2}'"
@@ -85,7 +98,9 @@ class TestDurationFormatting:
         """Test hours, minutes, seconds formatting without days."""
         # 12 hours, 34 minutes, 56 seconds = 45296 seconds
         duration = timedelta(seconds=45296)
-        line1, line2 = dns_counter_mock.format_duration(duration)
+        line1, line2 = dns_counter_mock.format_duration(
+            int(duration.total_seconds())
+        )
 
         assert line1 == "00y 00mo 00d", f"Expected '00y 00mo 00d', got '{line1}'"
         assert line2 == "12h 34m 56s", f"Expected '12h 34m 56s', got '{line2}'"
@@ -97,7 +112,7 @@ class TestPersistence:
     def test_persistence_save_load(self, dns_counter_mock, temp_persistence_file):
         """Save and load should round-trip a datetime correctly."""
         # Set a known datetime
-        test_time = datetime(2026, 1, 25, 10, 30, 45)
+        test_time = datetime(2026, 1, 25, 10, 30, 45, tzinfo=timezone.utc)
         dns_counter_mock.last_reset = test_time
 
         # Save state
@@ -111,26 +126,39 @@ class TestPersistence:
         # Load state
         loaded_time = dns_counter_mock.load_state()
 
-        # Verify datetime matches (isoformat should preserve up to microseconds)
+        # Verify datetime matches (float timestamp preserves whole seconds exactly)
         assert loaded_time == test_time, f"Expected {test_time}, got {loaded_time}"
 
     def test_persistence_file_structure(self, dns_counter_mock, temp_persistence_file):
-        """Saved JSON should have correct structure with version and last_reset."""
-        test_time = datetime(2026, 1, 25, 10, 30, 45)
+        """Saved file should be a single binary record of timestamp and version."""
+        import dns_counter
+
+        test_time = datetime(2026, 1, 25, 10, 30, 45, tzinfo=timezone.utc)
         dns_counter_mock.last_reset = test_time
 
         dns_counter_mock.save_state()
 
-        # Read and parse JSON
-        with open(temp_persistence_file, "r") as f:
-            data = json.load(f)
+        # Read and unpack the binary record
+        raw = temp_persistence_file.read_bytes()
+        assert len(raw) == 12, "State file should be 12 bytes (<dI)"
+
+        timestamp, version = dns_counter.STATE_STRUCT.unpack(raw)
+        assert version == dns_counter.STATE_VERSION, "Version should match"
+        assert timestamp == test_time.timestamp(), "Timestamp should be UNIX seconds"
+
+    def test_persistence_load_legacy_json(
+        self, dns_counter_mock, temp_persistence_file
+    ):
+        """JSON state files from earlier releases should still load."""
+        with open(temp_persistence_file, "w") as f:
+            json.dump({"last_reset": "2026-01-25T10:30:45+00:00", "version": 1}, f)
+
+        loaded_time = dns_counter_mock.load_state()
 
-        assert "version" in data, "JSON should contain 'version' key"
-        assert "last_reset" in data, "JSON should contain 'last_reset' key"
-        assert data["version"] == 1, "Version should be 1"
+        expected_time = datetime(2026, 1, 25, 10, 30, 45, tzinfo=timezone.utc)
         assert (
-            data["last_reset"] == test_time.isoformat()
-        ), "last_reset should be ISO format"
+            loaded_time == expected_time
+        ), f"Expected {expected_time}, got {loaded_time}"
 
     def test_persistence_corruption_invalid_json(
         self, dns_counter_mock, temp_persistence_file
@@ -143,7 +171,7 @@ class TestPersistence:
         # Freeze time to verify fallback
         with freeze_time("2026-01-25 15:00:00"):
             loaded_time = dns_counter_mock.load_state()
-            expected_time = datetime(2026, 1, 25, 15, 0, 0)
+            expected_time = datetime(2026, 1, 25, 15, 0, 0, tzinfo=timezone.utc)
 
             assert (
                 loaded_time == expected_time
@@ -159,7 +187,7 @@ class TestPersistence:
 
         with freeze_time("2026-01-25 16:00:00"):
             loaded_time = dns_counter_mock.load_state()
-            expected_time = datetime(2026, 1, 25, 16, 0, 0)
+            expected_time = datetime(2026, 1, 25, 16, 0, 0, tzinfo=timezone.utc)
 
             assert (
                 loaded_time == expected_time
@@ -173,7 +201,7 @@ class TestPersistence:
 
         with freeze_time("2026-01-25 17:00:00"):
             loaded_time = dns_counter_mock.load_state()
-            expected_time = datetime(2026, 1, 25, 17, 0, 0)
+            expected_time = datetime(2026, 1, 25, 17, 0, 0, tzinfo=timezone.utc)
 
             assert (
                 loaded_time == expected_time
@@ -182,25 +210,32 @@ class TestPersistence:
     def test_persistence_atomic_write(
         self, dns_counter_mock, temp_persistence_file, monkeypatch
     ):
-        """save_state() should use atomic write (tempfile + rename)."""
-        # Track calls to tempfile.NamedTemporaryFile and os.rename
+        """save_state() should use atomic write (tempfile + fsync + replace)."""
+        # Track calls to tempfile.NamedTemporaryFile, os.fsync and os.replace
         original_tempfile = tempfile.NamedTemporaryFile
-        original_rename = os.rename
+        original_replace = os.replace
+        original_fsync = os.fsync
 
         tempfile_calls = []
-        rename_calls = []
+        replace_calls = []
+        fsync_calls = []
 
         def mock_tempfile(*args, **kwargs):
             result = original_tempfile(*args, **kwargs)
             tempfile_calls.append((args, kwargs, result.name))
             return result
 
-        def mock_rename(src, dst):
-            rename_calls.append((src, dst))
-            return original_rename(src, dst)
+        def mock_replace(src, dst):
+            replace_calls.append((src, dst))
+            return original_replace(src, dst)
+
+        def mock_fsync(fd):
+            fsync_calls.append(fd)
+            return original_fsync(fd)
 
         monkeypatch.setattr(tempfile, "NamedTemporaryFile", mock_tempfile)
-        monkeypatch.setattr(os, "rename", mock_rename)
+        monkeypatch.setattr(os, "replace", mock_replace)
+        monkeypatch.setattr(os, "fsync", mock_fsync)
 
         # Perform save
         test_time = datetime(2026, 1, 25, 10, 30, 45)
@@ -214,25 +249,48 @@ class TestPersistence:
             str(temp_persistence_file)
         ), "Tempfile should be in same directory as target"
 
-        # Verify rename was called
-        assert len(rename_calls) == 1, "Should call rename exactly once"
-        src, dst = rename_calls[0]
+        # Verify the tempfile and its directory were both fsynced
+        assert len(fsync_calls) == 2, "Should fsync tempfile and directory"
+
+        # Verify replace was called
+        assert len(replace_calls) == 1, "Should call replace exactly once"
+        src, dst = replace_calls[0]
         assert dst == str(
             temp_persistence_file
         ), f"Should rename to {temp_persistence_file}"
 
+    def test_persistence_skips_unchanged_write(
+        self, dns_counter_mock, temp_persistence_file, monkeypatch
+    ):
+        """Saving the same last_reset twice should only write the file once."""
+        original_replace = os.replace
+        replace_calls = []
+
+        def mock_replace(src, dst):
+            replace_calls.append((src, dst))
+            return original_replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", mock_replace)
+
+        dns_counter_mock.last_reset = datetime(2026, 1, 25, 10, 30, 45)
+        dns_counter_mock.save_state()
+        dns_counter_mock.save_state()
+        assert len(replace_calls) == 1, "Unchanged state should not be rewritten"
+
+        dns_counter_mock.last_reset = datetime(2026, 1, 25, 10, 30, 46)
+        dns_counter_mock.save_state()
+        assert len(replace_calls) == 2, "Changed state should be written"
+
     def test_persistence_save_generic_exception(
         self, dns_counter_mock, temp_persistence_file, monkeypatch
     ):
         """Generic exception during save should be caught and logged."""
 
-        # Mock json.dump to raise a generic Exception
-        def mock_json_dump(*args, **kwargs):
+        # Mock os.replace to raise a generic Exception
+        def mock_replace(*args, **kwargs):
             raise RuntimeError("Simulated file system error")
 
-        import json
-
-        monkeypatch.setattr(json, "dump", mock_json_dump)
+        monkeypatch.setattr(os, "replace", mock_replace)
 
         # Save should not crash despite exception
         test_time = datetime(2026, 1, 25, 10, 30, 45)
@@ -241,6 +299,17 @@ class TestPersistence:
         # This should catch the exception and log it (lines 90-91)
         dns_counter_mock.save_state()  # Should not raise
 
+        # The temporary file must not be left behind
+        leftovers = [
+            name for name in os.listdir(os.path.dirname(temp_persistence_file))
+            if name != os.path.basename(temp_persistence_file)
+        ]
+        assert leftovers == [], f"Stray temporary files: {leftovers}"
+
+    @pytest.mark.skipif(
+        hasattr(os, "geteuid") and os.geteuid() == 0,
+        reason="root can read a chmod 000 file",
+    )
     def test_persistence_load_generic_exception(
         self, dns_counter_mock, temp_persistence_file
     ):
@@ -261,7 +330,7 @@ class TestPersistence:
             # PermissionError is caught by the generic Exception handler
             with freeze_time("2026-01-25 19:00:00"):
                 loaded_time = dns_counter_mock.load_state()
-                expected_time = datetime(2026, 1, 25, 19, 0, 0)
+                expected_time = datetime(2026, 1, 25, 19, 0, 0, tzinfo=timezone.utc)
 
                 assert (
                     loaded_time == expected_time
@@ -287,6 +356,62 @@ class TestResetLogic:
                 f"got {dns_counter_mock.last_reset}"
             )
 
+    @patch("time.monotonic")
+    def test_reset_debounces_rapid_calls(self, mock_monotonic, dns_counter_mock):
+        """Resets within RESET_DEBOUNCE_SECONDS should not save or play audio."""
+        mock_monotonic.return_value = 100.0
+        first, accepted = dns_counter_mock.reset()
+        assert accepted is True
+
+        mock_monotonic.return_value = 100.5
+        with patch.object(dns_counter_mock, "save_state") as mock_save:
+            assert dns_counter_mock.reset() == (first, False)
+            mock_save.assert_not_called()
+        assert dns_counter_mock.audio_plays == 1
+
+        mock_monotonic.return_value = 101.5
+        _, accepted = dns_counter_mock.reset()
+        assert accepted is True
+        assert dns_counter_mock.audio_plays == 2
+
+    @patch("time.monotonic")
+    def test_debounced_reset_is_not_counted(self, mock_monotonic, dns_counter_mock):
+        """Only accepted resets should increment the Prometheus reset counter."""
+        import dns_counter
+
+        with patch.object(dns_counter, "PROMETHEUS_AVAILABLE", True), \
+                patch.object(dns_counter, "RESET_COUNTER") as mock_counter:
+            mock_monotonic.return_value = 100.0
+            dns_counter_mock.reset(source="web")
+            mock_monotonic.return_value = 100.5
+            dns_counter_mock.reset(source="button")
+
+        mock_counter.labels.assert_called_once_with(source="web")
+        mock_counter.labels.return_value.inc.assert_called_once_with()
+
+    def test_reap_audio_reports_failed_aplay(self, dns_counter_mock):
+        """A finished aplay with a non-zero exit should be counted once."""
+        import dns_counter
+
+        running = MagicMock(returncode=None)
+        running.poll.return_value = None
+        failed = MagicMock(returncode=1)
+        failed.poll.return_value = 1
+
+        with patch.object(dns_counter, "PROMETHEUS_AVAILABLE", True), \
+                patch.object(dns_counter, "AUDIO_PLAYBACK_ERRORS") as mock_errors:
+            dns_counter_mock._audio_proc = running
+            dns_counter_mock._reap_audio()
+            assert dns_counter_mock._audio_proc is running
+            mock_errors.inc.assert_not_called()
+
+            dns_counter_mock._audio_proc = failed
+            dns_counter_mock._reap_audio()
+            dns_counter_mock._reap_audio()
+
+        assert dns_counter_mock._audio_proc is None
+        mock_errors.inc.assert_called_once_with()
+
     @patch("time.time")
     def test_debounce_prevents_multiple_resets(self, mock_time):
         """Two button presses within 0.3 seconds should only reset once."""
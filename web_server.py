@@ -11,6 +11,7 @@ No authentication - intended for local network use only.
 import json
 import logging
 import os
+import struct
 import subprocess
 import tempfile
 import threading
@@ -28,9 +29,25 @@ from metrics import (
     AUDIO_PLAYBACK_ERRORS, APP_START_TIME, PROMETHEUS_AVAILABLE
 )
 
+# Optional production WSGI server; falls back to Flask's built-in server
+try:
+    from waitress import serve as waitress_serve
+
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
 # Configure logging
 logger = logging.getLogger("dns_counter.web")
 
+# Binary state file layout shared with dns_counter.py:
+# little-endian float64 UNIX timestamp + uint32 version
+STATE_STRUCT = struct.Struct("<dI")
+STATE_VERSION = 2
+
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_config(config_path: str = "/usr/local/share/dnsfail/config.yaml") -> Dict[str, Any]:
     """Load configuration from YAML file with fallback to defaults."""
@@ -46,7 +63,7 @@ def load_config(config_path: str = "/usr/local/share/dnsfail/config.yaml") -> Di
 
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            loaded_config = yaml.safe_load(f)
+            loaded_config = yaml.load(f, Loader=YAML_LOADER)
 
         if loaded_config:
             config = DEFAULT_CONFIG.copy()
@@ -80,7 +97,9 @@ class WebServer:
         Args:
             config: Configuration dictionary (optional, loads from file if not provided)
             config_path: Path to config file (default: /usr/local/share/dnsfail/config.yaml)
-            reset_callback: Optional callback to invoke on reset (for state sync with main app)
+            reset_callback: Optional callback to invoke on reset (for state sync
+                with main app); called with source='web', returns
+                (last_reset, accepted)
             get_state_callback: Optional callback to get current state from main app
         """
         if config is None:
@@ -167,25 +186,30 @@ class WebServer:
         def reset_timer():
             """Reset the timer and play audio."""
             try:
-                # Increment reset counter for web source
-                RESET_COUNTER.labels(source='web').inc()
-
-                # Use callback if available (syncs with main app and plays audio)
+                # Use callback if available (syncs with main app and plays audio;
+                # the main app counts the reset only if it isn't debounced)
                 if self._reset_callback:
-                    new_reset = self._reset_callback()
+                    new_reset, accepted = self._reset_callback(source="web")
                     return jsonify({
                         "success": True,
+                        "accepted": accepted,
                         "last_reset": new_reset.isoformat() if hasattr(new_reset, 'isoformat') else str(new_reset),
-                        "message": "Timer reset successfully"
+                        "message": (
+                            "Timer reset successfully" if accepted
+                            else "Reset ignored (too soon after the previous reset)"
+                        ),
                     })
 
                 # Fallback: standalone mode (no main app)
+                if PROMETHEUS_AVAILABLE:
+                    RESET_COUNTER.labels(source='web').inc()
                 new_reset = datetime.now(timezone.utc)
                 self._save_state(new_reset)
                 self._play_audio()
 
                 return jsonify({
                     "success": True,
+                    "accepted": True,
                     "last_reset": new_reset.isoformat(),
                     "message": "Timer reset successfully"
                 })
@@ -200,9 +224,14 @@ class WebServer:
         """Load the current state from persistence file."""
         with self._lock:
             try:
-                with open(self.persistence_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                return data
+                with open(self.persistence_file, "rb") as f:
+                    raw = f.read()
+                if len(raw) == STATE_STRUCT.size:
+                    timestamp, _version = STATE_STRUCT.unpack(raw)
+                    last_reset = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+                    return {"last_reset": last_reset.isoformat()}
+                # Legacy JSON state file from an earlier release
+                return json.loads(raw)
             except FileNotFoundError:
                 # If no state file, return current time in UTC
                 return {"last_reset": datetime.now(timezone.utc).isoformat()}
@@ -213,8 +242,9 @@ class WebServer:
     def _save_state(self, last_reset: datetime) -> None:
         """Save state to persistence file using atomic write."""
         with self._lock:
+            tmp_name = None
             try:
-                data = {"last_reset": last_reset.isoformat(), "version": 1}
+                payload = STATE_STRUCT.pack(last_reset.timestamp(), STATE_VERSION)
                 dir_path = os.path.dirname(self.persistence_file)
 
                 # Ensure directory exists
@@ -223,16 +253,29 @@ class WebServer:
 
                 # Atomic write
                 with tempfile.NamedTemporaryFile(
-                    mode="w",
+                    mode="wb",
                     delete=False,
                     dir=dir_path or ".",
-                    encoding="utf-8",
                 ) as tf:
-                    json.dump(data, tf)
-                os.rename(tf.name, self.persistence_file)
-                logger.info(f"Saved state: {data}")
+                    tmp_name = tf.name
+                    tf.write(payload)
+                    tf.flush()
+                    os.fsync(tf.fileno())
+                os.replace(tf.name, self.persistence_file)
+                tmp_name = None
+                dir_fd = os.open(dir_path or ".", os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+                logger.info("Saved state: %s", last_reset)
             except Exception as e:
                 logger.error(f"Failed to save state: {e}")
+                if tmp_name is not None:
+                    try:
+                        os.unlink(tmp_name)
+                    except OSError:
+                        pass
                 raise
 
     def _play_audio(self) -> None:
@@ -242,12 +285,13 @@ class WebServer:
             return
 
         try:
-            cmd = ["aplay"]
+            # Small explicit buffer for low start-up latency (see dns_counter)
+            cmd = ["aplay", "--buffer-time=100000", "--period-time=25000"]
             if self.audio_device:
                 cmd.extend(["-D", self.audio_device])
             cmd.append(self.audio_file)
 
-            logger.debug(f"Playing audio: {' '.join(cmd)}")
+            logger.debug("Playing audio: %s", cmd)
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -265,14 +309,25 @@ class WebServer:
             logger.error(f"Audio playback error: {e}")
 
     def run(self, host: str = "0.0.0.0", debug: bool = False) -> None:
-        """Start the web server.
+        """Start the web server (blocks until it exits).
+
+        Serves with waitress when it is installed, otherwise (or in debug mode)
+        with Flask's built-in development server.
 
         Args:
             host: Host to bind to (default: 0.0.0.0 for all interfaces)
             debug: Enable Flask debug mode
         """
         logger.info(f"Starting web server on http://{host}:{self.port}")
-        self.app.run(host=host, port=self.port, debug=debug, threaded=True)
+        if WAITRESS_AVAILABLE and not debug:
+            waitress_serve(
+                self.app, host=host, port=self.port, threads=4, channel_timeout=30
+            )
+        else:
+            self.app.run(
+                host=host, port=self.port, debug=debug, threaded=True,
+                use_reloader=False,
+            )
 
 
 def create_app(config_path: Optional[str] = None) -> Flask: